@@ -1,5 +1,5 @@
 """Configuration management for SGTR-RL."""
 
-from .paths import get_data_path, get_dataset_path, DataPathError
+from .paths import get_data_path, get_dataset_path, get_dataset_path_and_list, DataPathError
 
-__all__ = ["get_data_path", "get_dataset_path", "DataPathError"]
+__all__ = ["get_data_path", "get_dataset_path", "get_dataset_path_and_list", "DataPathError"]
@@ -16,9 +16,13 @@ Usage:
     wikisum_path = get_dataset_path("wikisum")
 """
 
+from functools import lru_cache
+import json
+import os
+import secrets
+import stat
 from pathlib import Path
 from typing import Optional
-import yaml
 
 
 class DataPathError(Exception):
@@ -27,36 +31,112 @@ class DataPathError(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
-    """Get the project root directory (where pyproject.toml is located)."""
-    # Start from this file and go up until we find pyproject.toml
-    current = Path(__file__).resolve()
-    for parent in current.parents:
-        if (parent / "pyproject.toml").exists():
-            return parent
+    """Get the project root directory (where pyproject.toml is located).
+
+    The result is cached for the lifetime of the process.
+    """
+    # Start from this file's directory and go up until we find pyproject.toml,
+    # using plain string paths to avoid building a Path per ancestor
+    here = os.path.dirname(os.path.realpath(__file__))
+    current = here
+    while True:
+        if os.path.isfile(os.path.join(current, "pyproject.toml")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
     # Fallback: assume we're in sgtr_rl/config, so go up 2 levels
-    return Path(__file__).resolve().parents[2]
+    return Path(here).parents[1]
+
+
+def _read_config_cache(cache_file: Path, source_mtime_ns: int) -> Optional[dict]:
+    """Return the cached config if it was written from the current YAML file."""
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
 
+    if not isinstance(cached, dict) or cached.get("source_mtime_ns") != source_mtime_ns:
+        return None
+    return cached.get("config")
 
+
+def _write_config_cache(cache_file: Path, source_mtime_ns: int, config: dict) -> None:
+    """Atomically write the parsed config to its JSON cache, ignoring failures."""
+    try:
+        payload = json.dumps({"source_mtime_ns": source_mtime_ns, "config": config})
+    except (TypeError, ValueError):
+        return  # Config holds values JSON can't represent; always parse the YAML
+
+    # JSON silently turns non-string keys (e.g. 2024, or YAML's on/yes) into
+    # strings, so only cache configs that survive the round trip unchanged
+    if json.loads(payload)["config"] != config:
+        return
+
+    # Created with O_EXCL under a random sibling name and mode 0666, so the
+    # process umask applies as for any other file and readers in a shared
+    # checkout can use (and later replace) the cache
+    tmp_file = cache_file.with_name(f".{cache_file.name}.{secrets.token_hex(8)}")
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # A read-only checkout just means we re-parse the YAML next time
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=None)
 def load_config() -> dict:
     """Load data paths configuration from config/data_paths.yaml.
 
+    The config is parsed once and cached; the same dict is returned to every
+    caller, so it must not be mutated. Call ``load_config.cache_clear()`` to
+    force a re-read after the config file changes.
+
+    Across processes, the parsed YAML is cached in
+    config/data_paths.yaml.cache.json, which is reused for as long as the
+    YAML file's mtime is unchanged.
+
     Returns:
         dict: Configuration dictionary, or empty dict if file doesn't exist.
     """
     project_root = get_project_root()
     config_file = project_root / "config" / "data_paths.yaml"
 
-    if not config_file.exists():
+    try:
+        source_mtime_ns = os.stat(config_file).st_mtime_ns
+    except FileNotFoundError:
         return {}
 
+    cache_file = config_file.with_name(config_file.name + ".cache.json")
+    cached = _read_config_cache(cache_file, source_mtime_ns)
+    if cached is not None:
+        return cached
+
+    # Imported here so callers that never parse the YAML don't pay for it
+    import yaml
+
     try:
         with open(config_file) as f:
-            config = yaml.safe_load(f)
-            return config if config else {}
+            # Prefer libyaml's C loader; fall back to the pure-Python one
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            config = yaml.load(f, Loader=loader)
     except Exception as e:
         raise DataPathError(f"Failed to load config file {config_file}: {e}")
 
+    config = config if config else {}
+    _write_config_cache(cache_file, source_mtime_ns, config)
+    return config
+
 
 def get_data_path() -> Path:
     """Get the base path for cached generations data.
@@ -116,18 +196,38 @@ def get_data_path() -> Path:
     )
 
 
+def _dir_problem(path: Path) -> Optional[str]:
+    """Describe why path isn't a directory, using a single stat call.
+
+    Returns:
+        Optional[str]: None if path is a directory, otherwise "does not exist"
+        or "is not a directory".
+
+    Raises:
+        DataPathError: If path can't be checked for any other reason
+            (e.g. a permission error on a parent, or a symlink loop).
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return "does not exist"
+    except OSError as e:
+        raise DataPathError(f"Cannot access dataset path {path}: {e}") from e
+    return None if stat.S_ISDIR(mode) else "is not a directory"
+
+
 def get_dataset_path(dataset_name: str, check_exists: bool = True) -> Path:
     """Get path to a specific dataset within cached generations.
 
     Args:
         dataset_name: Name of dataset (e.g., "wikisum", "bigcodebench")
-        check_exists: If True, raise error if dataset doesn't exist
+        check_exists: If True, raise error if dataset isn't an existing directory
 
     Returns:
         Path: Absolute path to dataset directory.
 
     Raises:
-        DataPathError: If dataset path cannot be found (when check_exists=True).
+        DataPathError: If dataset path cannot be found or accessed (when check_exists=True).
 
     Example:
         >>> wikisum_path = get_dataset_path("wikisum")
@@ -144,9 +244,10 @@ def get_dataset_path(dataset_name: str, check_exists: bool = True) -> Path:
             project_root = get_project_root()
             dataset_path = project_root / dataset_path
 
-        if check_exists and not dataset_path.exists():
+        problem = _dir_problem(dataset_path) if check_exists else None
+        if problem is not None:
             raise DataPathError(
-                f"Dataset path specified in config does not exist: {dataset_path}\n"
+                f"Dataset path specified in config {problem}: {dataset_path}\n"
                 f"Dataset: {dataset_name}\n"
                 f"Please check config/data_paths.yaml"
             )
@@ -157,7 +258,14 @@ def get_dataset_path(dataset_name: str, check_exists: bool = True) -> Path:
     data_path = get_data_path()
     dataset_path = data_path / dataset_name
 
-    if check_exists and not dataset_path.exists():
+    problem = _dir_problem(dataset_path) if check_exists else None
+    if problem == "is not a directory":
+        raise DataPathError(
+            f"Dataset path is not a directory: {dataset_path}\n"
+            f"Dataset: {dataset_name}\n"
+            f"Please check that the data path points at the right location: {data_path}"
+        )
+    if problem is not None:
         raise DataPathError(
             f"Dataset not found: {dataset_name}\n"
             f"Expected location: {dataset_path}\n"
@@ -171,6 +279,38 @@ def get_dataset_path(dataset_name: str, check_exists: bool = True) -> Path:
     return dataset_path.resolve()
 
 
+def get_dataset_path_and_list(dataset_name: str) -> tuple[Path, list[str]]:
+    """Get path to a dataset together with the names of its entries.
+
+    Listing the directory doubles as the existence check, so callers that
+    need both avoid stat'ing the dataset path before reading it.
+
+    Args:
+        dataset_name: Name of dataset (e.g., "wikisum", "bigcodebench")
+
+    Returns:
+        tuple: (dataset_path, sorted entry names)
+
+    Raises:
+        DataPathError: If dataset path cannot be found or listed.
+
+    Example:
+        >>> wikisum_path, entries = get_dataset_path_and_list("wikisum")
+        >>> print(entries)
+        ['training_set_1-20']
+    """
+    dataset_path = get_dataset_path(dataset_name, check_exists=False)
+
+    try:
+        with os.scandir(dataset_path) as entries:
+            return dataset_path, sorted(entry.name for entry in entries)
+    except OSError as e:
+        # Re-run the checked lookup to raise the usual descriptive error for
+        # missing paths; anything else (e.g. permissions) is reported as-is
+        get_dataset_path(dataset_name)
+        raise DataPathError(f"Failed to list dataset directory {dataset_path}: {e}") from e
+
+
 def list_available_datasets() -> list[str]:
     """List available datasets in cached_generations directory.
 
@@ -184,9 +324,10 @@ def list_available_datasets() -> list[str]:
     """
     try:
         data_path = get_data_path()
-        # List subdirectories only
-        datasets = [d.name for d in data_path.iterdir() if d.is_dir()]
-        return sorted(datasets)
+        # List subdirectories only; DirEntry.is_dir() reuses the file type
+        # reported by the directory listing instead of stat'ing each entry
+        with os.scandir(data_path) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
     except DataPathError:
         return []
 
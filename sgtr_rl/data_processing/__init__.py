@@ -5,7 +5,7 @@ and creating DPO training triples.
 """
 
 from .eval_loader import load_eval_file, load_experiment_evals, EvalSample, categorize_sample
-from .triple_generator import create_dpo_triples, DPOTriple
+from .triple_generator import create_dpo_triples, iter_dpo_triples, DPOTriple
 
 __all__ = [
     "load_eval_file",
@@ -13,5 +13,6 @@ __all__ = [
     "EvalSample",
     "categorize_sample",
     "create_dpo_triples",
+    "iter_dpo_triples",
     "DPOTriple",
 ]
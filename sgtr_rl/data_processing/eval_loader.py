@@ -5,6 +5,7 @@ samples for DPO training.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 import re
@@ -42,6 +43,14 @@ class EvalSample:
     experiment: str
     metadata: dict
 
+    @cached_property
+    def category(self) -> str:
+        """TP, TN, FP, or FN category, computed on first access.
+
+        See categorize_sample for the definitions.
+        """
+        return _compute_category(self)
+
 
 def extract_reasoning_and_answer(sample: InspectEvalSample) -> tuple[str, str]:
     """Extract reasoning and final answer from inspect_ai sample.
@@ -239,12 +248,19 @@ def categorize_sample(sample: EvalSample) -> str:
     - FP: Other's text (target="2") → Model claims authorship (answer="1") ✗
     - FN: Model's text (target="1") → Model doesn't claim (answer="2") ✗
 
+    The result is cached on the sample, so repeated calls are cheap.
+
     Args:
         sample: EvalSample to categorize
 
     Returns:
         str: "TP", "TN", "FP", or "FN"
     """
+    return sample.category
+
+
+def _compute_category(sample: EvalSample) -> str:
+    """Compute the TP/TN/FP/FN category for categorize_sample."""
     # Determine if text was generated by evaluator model
     # In IND recognition:
     # - If evaluator == generator → target should be "1" (this is my text)
@@ -5,13 +5,17 @@ from SGTR evaluation data.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+import sys
+from typing import Iterable, Iterator, Optional
 from collections import defaultdict
 
 from .eval_loader import EvalSample, categorize_sample
 
+# Target size of each buffered write in save_triples_jsonl
+_WRITE_CHUNK_BYTES = 1 << 20
 
-@dataclass
+
+@dataclass(slots=True)
 class DPOTriple:
     """DPO training triple.
 
@@ -48,106 +52,167 @@ def format_response(sample: EvalSample, include_reasoning: bool = True) -> str:
         return sample.answer
 
 
-def create_dpo_triples(
-    samples: list[EvalSample],
+def _prepare_chosen(
+    entries: list[tuple[EvalSample, str]],
+    include_reasoning: bool,
+) -> list[tuple[str, dict]]:
+    """Format chosen-side responses and metadata for (sample, category) entries.
+
+    Run-level fields repeat across nearly every triple, so they are interned
+    to share a single string object.
+    """
+    return [
+        (
+            format_response(sample, include_reasoning),
+            {
+                "chosen_sample_id": sample.sample_id,
+                "chosen_category": category,
+                "evaluator_model": sys.intern(sample.evaluator_model),
+                "chosen_generator": sys.intern(sample.generator_model),
+                "dataset": sys.intern(sample.dataset),
+                "experiment": sys.intern(sample.experiment),
+            },
+        )
+        for sample, category in entries
+    ]
+
+
+def _prepare_rejected(
+    entries: list[tuple[EvalSample, str]],
+    include_reasoning: bool,
+) -> list[tuple[str, dict]]:
+    """Format rejected-side responses and metadata for (sample, category) entries."""
+    return [
+        (
+            format_response(sample, include_reasoning),
+            {
+                "rejected_sample_id": sample.sample_id,
+                "rejected_category": category,
+                "rejected_generator": sys.intern(sample.generator_model),
+            },
+        )
+        for sample, category in entries
+    ]
+
+
+def iter_dpo_triples(
+    samples: Iterable[EvalSample],
     include_reasoning: bool = True,
     require_same_prompt: bool = True,
-) -> list[DPOTriple]:
-    """Create DPO training triples from evaluation samples.
+) -> Iterator[DPOTriple]:
+    """Lazily generate DPO training triples from evaluation samples.
 
-    Strategy:
-    - Chosen: Correct samples (TP or TN)
-    - Rejected: Incorrect samples (FP or FN)
-    - Pair by matching prompts when possible
-
-    Args:
-        samples: List of EvalSamples from evaluations
-        include_reasoning: Whether to include CoT reasoning in responses
-        require_same_prompt: If True, only create triples where chosen/rejected
-                           have the same prompt. If False, allow mismatched prompts.
-
-    Returns:
-        list[DPOTriple]: DPO training triples
+    Same pairing strategy and arguments as create_dpo_triples, but triples are
+    yielded one at a time so a generate -> save pipeline never holds them all
+    in memory.
 
     Example:
-        >>> triples = create_dpo_triples(samples)
-        >>> print(f"Created {len(triples)} DPO triples")
+        >>> save_triples_jsonl(iter_dpo_triples(samples), "triples.jsonl")
     """
-    # Categorize samples
-    correct_samples = []  # TP and TN
-    incorrect_samples = []  # FP and FN
+    # Categorize samples once, keeping each sample's category alongside it
+    correct_samples = []  # (sample, category) for TP and TN
+    incorrect_samples = []  # (sample, category) for FP and FN
 
     for sample in samples:
         category = categorize_sample(sample)
-        if category in ["TP", "TN"]:
-            correct_samples.append(sample)
+        if category in ("TP", "TN"):
+            correct_samples.append((sample, category))
         else:  # FP or FN
-            incorrect_samples.append(sample)
+            incorrect_samples.append((sample, category))
 
-    triples = []
+    # All-correct or all-incorrect sets can't produce any pairs
+    if not correct_samples or not incorrect_samples:
+        return
 
     if require_same_prompt:
         # Group by prompt for matching
         correct_by_prompt = defaultdict(list)
         incorrect_by_prompt = defaultdict(list)
 
-        for sample in correct_samples:
-            correct_by_prompt[sample.prompt].append(sample)
+        for sample, category in correct_samples:
+            correct_by_prompt[sample.prompt].append((sample, category))
 
-        for sample in incorrect_samples:
-            incorrect_by_prompt[sample.prompt].append(sample)
+        for sample, category in incorrect_samples:
+            incorrect_by_prompt[sample.prompt].append((sample, category))
 
-        # Create triples by matching prompts
-        for prompt in correct_by_prompt:
-            if prompt not in incorrect_by_prompt:
+        # No prompt has both a correct and an incorrect sample
+        if correct_by_prompt.keys().isdisjoint(incorrect_by_prompt):
+            return
+
+        # Create triples by matching prompts. Iterate in correct_by_prompt order
+        # rather than over a set intersection so triple order is deterministic.
+        for prompt, correct_entries in correct_by_prompt.items():
+            incorrect_entries = incorrect_by_prompt.get(prompt)
+            if not incorrect_entries:
                 continue  # No matching incorrect sample for this prompt
 
+            # Format responses and metadata once per sample rather than per pair
+            chosen_sides = _prepare_chosen(correct_entries, include_reasoning)
+            rejected_sides = _prepare_rejected(incorrect_entries, include_reasoning)
+
             # Pair each correct with each incorrect for this prompt
-            for correct_sample in correct_by_prompt[prompt]:
-                for incorrect_sample in incorrect_by_prompt[prompt]:
-                    triple = DPOTriple(
+            for chosen, chosen_meta in chosen_sides:
+                for rejected, rejected_meta in rejected_sides:
+                    yield DPOTriple(
                         prompt=prompt,
-                        chosen=format_response(correct_sample, include_reasoning),
-                        rejected=format_response(incorrect_sample, include_reasoning),
-                        metadata={
-                            "chosen_sample_id": correct_sample.sample_id,
-                            "rejected_sample_id": incorrect_sample.sample_id,
-                            "chosen_category": categorize_sample(correct_sample),
-                            "rejected_category": categorize_sample(incorrect_sample),
-                            "evaluator_model": correct_sample.evaluator_model,
-                            "chosen_generator": correct_sample.generator_model,
-                            "rejected_generator": incorrect_sample.generator_model,
-                            "dataset": correct_sample.dataset,
-                            "experiment": correct_sample.experiment,
-                        },
+                        chosen=chosen,
+                        rejected=rejected,
+                        metadata={**chosen_meta, **rejected_meta},
                     )
-                    triples.append(triple)
 
     else:
         # Pair all correct with all incorrect (no prompt matching)
         # This creates many more triples but might be useful for diversity
-        for correct_sample in correct_samples:
-            for incorrect_sample in incorrect_samples:
-                triple = DPOTriple(
-                    prompt=correct_sample.prompt,  # Use correct sample's prompt
-                    chosen=format_response(correct_sample, include_reasoning),
-                    rejected=format_response(incorrect_sample, include_reasoning),
+        # Format responses and metadata once per sample rather than per pair
+        chosen_sides = zip(correct_samples, _prepare_chosen(correct_samples, include_reasoning))
+        rejected_sides = [
+            (sample.prompt, rejected, rejected_meta)
+            for (sample, _), (rejected, rejected_meta) in zip(
+                incorrect_samples, _prepare_rejected(incorrect_samples, include_reasoning)
+            )
+        ]
+
+        for (correct_sample, _), (chosen, chosen_meta) in chosen_sides:
+            prompt = correct_sample.prompt  # Use correct sample's prompt
+            for rejected_prompt, rejected, rejected_meta in rejected_sides:
+                yield DPOTriple(
+                    prompt=prompt,
+                    chosen=chosen,
+                    rejected=rejected,
                     metadata={
-                        "chosen_sample_id": correct_sample.sample_id,
-                        "rejected_sample_id": incorrect_sample.sample_id,
-                        "chosen_category": categorize_sample(correct_sample),
-                        "rejected_category": categorize_sample(incorrect_sample),
-                        "evaluator_model": correct_sample.evaluator_model,
-                        "chosen_generator": correct_sample.generator_model,
-                        "rejected_generator": incorrect_sample.generator_model,
-                        "dataset": correct_sample.dataset,
-                        "experiment": correct_sample.experiment,
-                        "prompt_mismatch": correct_sample.prompt != incorrect_sample.prompt,
+                        **chosen_meta,
+                        **rejected_meta,
+                        "prompt_mismatch": prompt != rejected_prompt,
                     },
                 )
-                triples.append(triple)
 
-    return triples
+
+def create_dpo_triples(
+    samples: list[EvalSample],
+    include_reasoning: bool = True,
+    require_same_prompt: bool = True,
+) -> list[DPOTriple]:
+    """Create DPO training triples from evaluation samples.
+
+    Strategy:
+    - Chosen: Correct samples (TP or TN)
+    - Rejected: Incorrect samples (FP or FN)
+    - Pair by matching prompts when possible
+
+    Args:
+        samples: List of EvalSamples from evaluations
+        include_reasoning: Whether to include CoT reasoning in responses
+        require_same_prompt: If True, only create triples where chosen/rejected
+                           have the same prompt. If False, allow mismatched prompts.
+
+    Returns:
+        list[DPOTriple]: DPO training triples
+
+    Example:
+        >>> triples = create_dpo_triples(samples)
+        >>> print(f"Created {len(triples)} DPO triples")
+    """
+    return list(iter_dpo_triples(samples, include_reasoning, require_same_prompt))
 
 
 def split_triples(
@@ -176,17 +241,19 @@ def split_triples(
     shuffled = triples.copy()
     random.shuffle(shuffled)
 
-    # Split
+    # Split, reusing the shuffled copy as the training set rather than
+    # slicing out a second copy of it
     train_size = int(len(shuffled) * train_ratio)
 
-    train_triples = shuffled[:train_size]
     val_triples = shuffled[train_size:]
+    del shuffled[train_size:]
+    train_triples = shuffled
 
     return train_triples, val_triples
 
 
 def save_triples_jsonl(
-    triples: list[DPOTriple],
+    triples: Iterable[DPOTriple],
     output_path: str,
 ) -> None:
     """Save DPO triples to JSONL file.
@@ -194,24 +261,58 @@ def save_triples_jsonl(
     Format compatible with Tinker DPO training:
     {"prompt": "...", "chosen": "...", "rejected": "...", "metadata": {...}}
 
+    Records are encoded with orjson when it is installed, falling back to
+    the stdlib json encoder otherwise.
+
     Args:
-        triples: List of DPO triples
+        triples: DPO triples; any iterable, so iter_dpo_triples output can be
+                 streamed straight to disk
         output_path: Path to output JSONL file
     """
-    import json
     from pathlib import Path
 
+    try:
+        import orjson
+
+        encode = orjson.dumps
+    except ImportError:
+        import json
+
+        def encode(record: dict) -> bytes:
+            return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_file, "w") as f:
+    # Join encoded records into ~1 MB chunks so large outputs take a handful
+    # of writes instead of one per triple
+    chunk = []
+    chunk_bytes = 0
+    count = 0
+
+    with open(output_file, "wb") as f:
         for triple in triples:
-            record = {
-                "prompt": triple.prompt,
-                "chosen": triple.chosen,
-                "rejected": triple.rejected,
-                "metadata": triple.metadata,
-            }
-            f.write(json.dumps(record) + "\n")
-
-    print(f"Saved {len(triples)} triples to {output_path}")
+            line = (
+                encode(
+                    {
+                        "prompt": triple.prompt,
+                        "chosen": triple.chosen,
+                        "rejected": triple.rejected,
+                        "metadata": triple.metadata,
+                    }
+                )
+                + b"\n"
+            )
+            chunk.append(line)
+            chunk_bytes += len(line)
+            count += 1
+
+            if chunk_bytes >= _WRITE_CHUNK_BYTES:
+                f.write(b"".join(chunk))
+                chunk.clear()
+                chunk_bytes = 0
+
+        if chunk:
+            f.write(b"".join(chunk))
+
+    print(f"Saved {count} triples to {output_path}")
@@ -7,7 +7,7 @@ Usage:
 """
 
 from pathlib import Path
-from sgtr_rl.config import get_dataset_path
+from sgtr_rl.config import get_dataset_path_and_list
 from sgtr_rl.data_processing import load_experiment_evals, create_dpo_triples, categorize_sample
 
 
@@ -20,6 +20,7 @@ def main():
 
     # Test with WikiSum dataset, Qwen3-80B evaluations
     dataset = "wikisum"
+    training_set = "training_set_1-20"
     experiment = "ICML_04_UT_IND-Q_Rec_NPr_FA_Rsn"
     evaluator = "qwen-3.0-80b-thinking"
 
@@ -28,9 +29,15 @@ def main():
     print(f"Evaluator: {evaluator}")
     print()
 
-    # Get experiment directory
-    dataset_path = get_dataset_path(dataset)
-    experiment_dir = dataset_path / "training_set_1-20" / experiment
+    # Get experiment directory; the dataset listing doubles as the existence
+    # check for both the dataset and the training set
+    dataset_path, dataset_entries = get_dataset_path_and_list(dataset)
+    if training_set not in dataset_entries:
+        print(f"❌ Training set not found: {dataset_path / training_set}")
+        print(f"   Available: {', '.join(dataset_entries) or '(none)'}")
+        return 1
+
+    experiment_dir = dataset_path / training_set / experiment
 
     if not experiment_dir.exists():
         print(f"❌ Experiment directory not found: {experiment_dir}")